@@ -1,40 +1,56 @@
 import os
 import asyncio
-from flask import Flask
 from config import PokerTournamentConfig
 from player import PokerPlayer
 from poker_game import PokerGame
 from logging_system import Logger
-from database import TournamentDatabase
 from utils import generate_player_name
 
-app = Flask(__name__)
+_flask_app = None
 
-@app.route('/')
-def home():
-    return "Tournament is running!"
+def create_app():
+    """Создание Flask-приложения. Flask импортируется только здесь."""
+    from flask import Flask
+
+    flask_app = Flask(__name__)
+
+    @flask_app.route('/')
+    def home():
+        return "Tournament is running!"
+
+    return flask_app
+
+def __getattr__(name):
+    """Ленивое создание `app.app` (например, для gunicorn), чтобы импорт модуля не тянул Flask."""
+    global _flask_app
+    if name == "app":
+        if _flask_app is None:
+            _flask_app = create_app()
+        return _flask_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def setup_tournament(num_players=160, load_previous_state=False, config=None):
+    """Инициализация турнира и создание игроков; объекты стратегий создаются при первом решении игрока."""
+    if config is None:
+        config = PokerTournamentConfig()
+
+    # Один просмотр каталога вместо проверки файла для каждого игрока
+    saved_states = set(os.listdir('.')) if load_previous_state else set()
 
-def setup_tournament(num_players=160, load_previous_state=False):
-    """Инициализация турнира, создание игроков и загрузка состояний, если это необходимо."""
-    config = PokerTournamentConfig()
-    
     players = []
     for i in range(num_players):
         player_name = generate_player_name()
-        player = PokerPlayer(player_name, config.starting_stack)
-        
-        if load_previous_state and os.path.exists(f"{player_name}_state.pkl"):
-            player.load_state(f"{player_name}_state.pkl")
-        
+        state_file = f"{player_name}_state.pkl"
+        player = PokerPlayer(player_name, config.starting_stack, iterations=config.mccfr_iterations,
+                             state_file=state_file if state_file in saved_states else None)
         players.append(player)
     
     return PokerGame(players, config)
 
-async def main():
+async def main(num_players=160, load_previous_state=False, config=None):
     """Основная функция запуска турнира."""
-    
-    num_players = 160  # Настройка количества игроков
-    
+    from database import TournamentDatabase
+
     # Инициализация базы данных для хранения результатов
     db = TournamentDatabase()
     
@@ -42,8 +58,7 @@ async def main():
     logger = Logger()
     
     # Настройка и запуск турнира
-    load_previous_state = False  # Задайте True, если хотите загружать состояние
-    game = setup_tournament(num_players, load_previous_state)
+    game = setup_tournament(num_players, load_previous_state, config)
     
     # Логгирование события: старт турнира
     logger.log_event("Tournament started")
@@ -70,12 +85,13 @@ async def main():
         # Логгирование события: завершение турнира
         logger.log_event("Tournament finished")
     except Exception as e:
-        # Логгирование возникновения ошибки
+        # Логгирование возникновения ошибки и передача её вызывающему коду
         logger.log_event(f"An error occurred: {str(e)}")
+        raise
 
 if __name__ == "__main__":
     # Запуск Flask на порту 10000
-    app.run(host="0.0.0.0", port=10000)
+    create_app().run(host="0.0.0.0", port=10000)
 
     # Запуск асинхронной симуляции
     asyncio.run(main())
@@ -0,0 +1,116 @@
+# cli.py
+"""
+Консольный запуск без веб-сервера: python -m cli {simulate,train,bench,serve} [--config config.json]
+
+Тяжёлые зависимости (Flask, sqlite) импортируются только теми командами, которым они нужны.
+"""
+
+import argparse
+import sys
+
+def load_config(file_name=None):
+    """Конфигурация из файла, либо стандартная PokerTournamentConfig."""
+    from config import PokerTournamentConfig
+
+    if file_name:
+        return PokerTournamentConfig.from_file(file_name)
+    return PokerTournamentConfig()
+
+def run_simulate(args):
+    """Полная симуляция турнира с сохранением результатов в базу."""
+    import asyncio
+    from app import main
+
+    asyncio.run(main(args.players, args.load_state, load_config(args.config)))
+
+def run_train(args):
+    """Итерации MCCFR для игроков и сохранение их состояния."""
+    from player import PokerPlayer
+    from utils import generate_player_name
+
+    config = load_config(args.config)
+    big_blind = config.get_blinds_for_round(1)['big_blind']
+    iterations = args.iterations if args.iterations is not None else config.mccfr_iterations
+
+    for i in range(args.players):
+        # Номер в имени: у generate_player_name всего 12 вариантов, файлы состояний не должны совпадать
+        player = PokerPlayer(f"{generate_player_name()} {i + 1}", config.starting_stack, iterations=iterations)
+        player.strategy_system.run_iterations([{"current_bet": big_blind}])
+        player.save_state()
+        print(f"{player.name}: {iterations} итераций, состояние сохранено")
+
+def run_bench(args):
+    """Замер времени создания турнира и перебалансировки столов."""
+    import random
+    import time
+    from app import setup_tournament
+
+    config = load_config(args.config)
+
+    start = time.perf_counter()
+    game = setup_tournament(args.players, config=config)
+    setup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rounds = 0
+    while len(game.players) > 1 and rounds < args.rounds:
+        for player in random.sample(game.players, min(args.busts, len(game.players) - 1)):
+            player.stack = 0
+            game.check_bust(player)
+        game.reorganize_tables()
+        rounds += 1
+    rebalance_time = time.perf_counter() - start
+
+    print(f"setup_tournament({args.players}): {setup_time * 1000:.2f} ms")
+    if rounds:
+        print(f"reorganize_tables: {rebalance_time / rounds * 1000:.3f} ms/раунд ({rounds} раундов)")
+
+def run_serve(args):
+    """Запуск веб-сервера Flask."""
+    from app import create_app
+
+    create_app().run(host=args.host, port=args.port)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Симуляция покерного турнира")
+    parser.add_argument("--config", help="JSON-файл конфигурации турнира вместо стандартной")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # --config принимается и после подкоманды; SUPPRESS не затирает значение, заданное до неё
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", default=argparse.SUPPRESS, help="JSON-файл конфигурации турнира вместо стандартной")
+
+    simulate = subparsers.add_parser("simulate", parents=[common], help="симуляция турнира")
+    simulate.add_argument("--players", type=int, default=160)
+    simulate.add_argument("--load-state", action="store_true", help="загружать сохранённые состояния игроков")
+    simulate.set_defaults(handler=run_simulate)
+
+    train = subparsers.add_parser("train", parents=[common], help="обучение стратегий MCCFR")
+    train.add_argument("--players", type=int, default=8)
+    train.add_argument("--iterations", type=int, help="по умолчанию mccfr_iterations из конфигурации")
+    train.set_defaults(handler=run_train)
+
+    bench = subparsers.add_parser("bench", parents=[common], help="замер производительности")
+    bench.add_argument("--players", type=int, default=160)
+    bench.add_argument("--rounds", type=int, default=100)
+    bench.add_argument("--busts", type=int, default=3, help="выбывших игроков за раунд")
+    bench.set_defaults(handler=run_bench)
+
+    serve = subparsers.add_parser("serve", parents=[common], help="веб-сервер")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=10000)
+    serve.set_defaults(handler=run_serve)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        args.handler(args)
+    except Exception as e:
+        print(f"Ошибка: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+import json
+
 class PokerTournamentConfig:
     def __init__(self):
         self.round_duration_minutes = 6
@@ -17,8 +19,41 @@ class PokerTournamentConfig:
         self.blinds_structure = self.initial_blinds_structure.copy()
         self.starting_stack = 10000
         self.payout_structure = {1: 0.5, 2: 0.3, 3: 0.2}
+        self.mccfr_iterations = 1000  # Итерации MCCFR на каждое решение игрока
         self.additional_rounds = 0  # Для расчета общего количества добавленных раундов
 
+    @classmethod
+    def from_file(cls, file_name):
+        """Загрузка конфигурации турнира из JSON-файла; отсутствующие ключи берутся по умолчанию."""
+        with open(file_name, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        config = cls()
+        if not isinstance(data, dict):
+            raise ValueError("Файл конфигурации должен содержать JSON-объект")
+        unknown = set(data) - set(vars(config))
+        if unknown:
+            raise ValueError(f"Неизвестные параметры конфигурации: {', '.join(sorted(unknown))}")
+
+        for key, value in data.items():
+            if key in ('blinds_structure', 'initial_blinds_structure', 'payout_structure') and not isinstance(value, dict):
+                raise ValueError(f"Параметр {key} должен быть JSON-объектом")
+            if key in ('blinds_structure', 'initial_blinds_structure'):
+                if not all(isinstance(blinds, dict) for blinds in value.values()):
+                    raise ValueError(f"Уровни {key} должны быть JSON-объектами")
+                value = {int(level): dict(blinds) for level, blinds in value.items()}
+            elif key == 'payout_structure':
+                value = {int(position): percentage for position, percentage in value.items()}
+            setattr(config, key, value)
+
+        if 'blinds_structure' in data and 'initial_blinds_structure' not in data:
+            config.initial_blinds_structure = config.blinds_structure.copy()
+        elif 'initial_blinds_structure' in data and 'blinds_structure' not in data:
+            config.blinds_structure = config.initial_blinds_structure.copy()
+
+        config.validate_configuration()
+        return config
+
     def get_blinds_for_round(self, round_number):
         """Возвращает структуру блайндов для конкретного раунда."""
         if round_number in self.blinds_structure:
@@ -27,16 +62,15 @@ class PokerTournamentConfig:
         last_round = max(self.blinds_structure.keys())
 
         if round_number > last_round:
-            self.additional_rounds += 1
-            new_small_blind = self.blinds_structure[last_round]['small_blind'] * 2
-            new_big_blind = self.blinds_structure[last_round]['big_blind'] * 2
-            new_ante = self.blinds_structure[last_round]['ante'] * 2
-
-            self.blinds_structure[round_number] = {
-                'small_blind': new_small_blind,
-                'big_blind': new_big_blind,
-                'ante': new_ante
-            }
+            # Уровни добавляются по одному, чтобы не было пропусков при запросе раунда "через уровень"
+            for new_round in range(last_round + 1, round_number + 1):
+                self.additional_rounds += 1
+                previous = self.blinds_structure[new_round - 1]
+                self.blinds_structure[new_round] = {
+                    'small_blind': previous['small_blind'] * 2,
+                    'big_blind': previous['big_blind'] * 2,
+                    'ante': previous['ante'] * 2
+                }
             return self.blinds_structure[round_number]
         else:
             raise ValueError(f"Round {round_number} out of range!")
@@ -3,9 +3,14 @@ from functools import lru_cache
 
 class HandEvaluator:
     @staticmethod
-    @lru_cache(maxsize=None)
     def evaluate_hand(hand):
         """Оценивает комбинацию у игрока и возвращает название комбинации и ранжированные значения карт."""
+        return HandEvaluator.evaluate_cards(frozenset(hand))  # Порядок карт не важен, список не хешируется
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def evaluate_cards(hand):
+        """Кэшируемая оценка набора карт."""
         values = sorted([HandEvaluator.rank_to_value(card[0]) for card in hand], reverse=True)
         is_flush = len(set(suit for _, suit in hand)) == 1
         is_straight = HandEvaluator.is_straight(values)
@@ -72,6 +77,8 @@ class HandEvaluator:
     def rank_to_value(rank):
         """Преобразует ранг карты в числовое значение для удобства оценки."""
         rank_values = {'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+        if isinstance(rank, int):
+            return rank
         return int(rank) if rank.isdigit() else rank_values.get(rank, rank)
 
     @staticmethod
@@ -8,7 +8,8 @@ class Logger:
             log_file, maxBytes=max_log_size, backupCount=backup_count)
         handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
-        self.logger = logging.getLogger()
+        # Отдельный логгер турнира: отладочные сообщения библиотек (asyncio и др.) не попадают в журнал
+        self.logger = logging.getLogger("tournament")
         self.logger.setLevel(logging.DEBUG)
         self.logger.addHandler(handler)
 
@@ -35,3 +36,21 @@ class Logger:
     def log_fold_equity(self, player_name, opponent_name, fold_equity):
         """Логирование оценки вероятности фолда."""
         self.logger.debug(f"{player_name} оценивает вероятность фолда {opponent_name} как {fold_equity:.2f}")
+
+class NullLogger:
+    """Логгер без вывода, с тем же интерфейсом; для служебных симуляций, например оценки исхода турнира."""
+
+    def log_event(self, message):
+        pass
+
+    def log_decision(self, player_name, decision, game_state):
+        pass
+
+    def log_result(self, winner_name, pot):
+        pass
+
+    def log_strategy(self, player_name, strategy):
+        pass
+
+    def log_fold_equity(self, player_name, opponent_name, fold_equity):
+        pass
@@ -1,11 +1,17 @@
 import random
 from collections import defaultdict
 
+def empty_strategy_entry():
+    """Начальная запись стратегии: [регреты, кумулятивная стратегия]."""
+    return [0, 0]
+
 class MCCFR:
+    rng = random  # Источник случайности, задаётся через PokerPlayer.set_rng
+
     def __init__(self, player, iterations=1000):
         self.player = player
         self.iterations = iterations
-        self.strategy = defaultdict(lambda: [0, 0])  # Хранение стратегии: [регреты, кумулятивная стратегия]
+        self.strategy = defaultdict(empty_strategy_entry)  # Хранение стратегии: [регреты, кумулятивная стратегия]
 
     def run_iterations(self, game_history, iterations=None):
         """Запуск итераций MCCFR для улучшения стратегии."""
@@ -33,7 +39,7 @@ class MCCFR:
         cumulative = sum(max(self.strategy[a][0], 0) for a in self.strategy)
         if cumulative > 0:
             return max(self.strategy[action][0], 0) / cumulative
-        return 1.0 / len(self.strategy)  # Равная вероятность для всех действий если нет регрета
+        return 1.0 / 3  # Равная вероятность для всех действий (fold, call, raise) если нет регрета
 
     def calculate_regret(self, game_history, action):
         """Рассчитывает сожаление за выполнение данного действия в игровом контексте."""
@@ -46,11 +52,11 @@ class MCCFR:
         current_bet = game_history[-1]["current_bet"]
         return {
             'fold': -current_bet,
-            'call': random.randint(-current_bet, current_bet),
-            'raise': random.randint(current_bet, 2 * current_bet),
+            'call': self.rng.randint(-current_bet, current_bet),
+            'raise': self.rng.randint(current_bet, 2 * current_bet),
         }
 
     def decide(self, game_state, dossier):
         """Принятие решения на основе оптимизированной стратегии MCCFR."""
-        self.run_iterations(game_state)
+        self.run_iterations([game_state])  # История из одного текущего состояния
         return max(self.strategy, key=lambda x: self.strategy[x][1])  # Действие с наибольшей кумулятивной стратегией
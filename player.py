@@ -3,18 +3,42 @@ import pickle
 from mccfr import MCCFR
 
 class PokerPlayer:
-    def __init__(self, name, stack, use_mccfr=True, iterations=1000):
+    def __init__(self, name, stack, use_mccfr=True, iterations=1000, state_file=None):
         self.name = name
         self.stack = stack
         self.initial_stack = stack
         self.history = []  # История действий игрока
         self.dossier = {}  # Досье на других игроков
         self.use_mccfr = use_mccfr
-        
-        if use_mccfr:
-            self.strategy_system = MCCFR(self, iterations)  # Используем MCCFR
-        else:
-            self.strategy_system = BasicPokerStrategy()
+        self.iterations = iterations
+        self._strategy_system = None
+        self.saved_strategy = None  # Стратегия из файла состояния, применяется при создании стратегии
+        self.rng = None  # Источник случайности стратегии; None — модуль random
+
+        if state_file is not None:
+            self.load_state(state_file)
+
+    @property
+    def strategy_system(self):
+        """Объект стратегии создаётся при первом обращении (обычно при первом решении игрока)."""
+        if self._strategy_system is None:
+            if self.use_mccfr:
+                self._strategy_system = MCCFR(self, self.iterations)  # Используем MCCFR
+            else:
+                self._strategy_system = BasicPokerStrategy()
+
+            if self.rng is not None:
+                self._strategy_system.rng = self.rng
+            if self.saved_strategy is not None:
+                self._strategy_system.strategy = self.saved_strategy
+                self.saved_strategy = None
+        return self._strategy_system
+
+    def set_rng(self, rng):
+        """Задаёт источник случайности для стратегии игрока (например, random.Random(seed))."""
+        self.rng = rng
+        if self._strategy_system is not None:
+            self._strategy_system.rng = rng
 
     def make_decision(self, game_state):
         """Принимаем решение на основе MCCFR стратегии"""
@@ -37,8 +61,8 @@ class PokerPlayer:
 
     def adjust_strategy(self):
         """Выполнение итераций MCCFR для улучшения стратегии"""
-        if self.use_mccfr:
-            self.strategy_system.run_iterations(self.history)
+        if self.use_mccfr and self.history:
+            self.strategy_system.run_iterations([entry["game_state"] for entry in self.history])
 
     def estimate_fold_equity(self, opponent_name, current_bet, pot_size, stage, aggression_level=1):
         """Оценка вероятности фолда противника."""
@@ -73,9 +97,14 @@ class PokerPlayer:
             state = pickle.load(file)
             self.history = state["history"]
             self.dossier = state["dossier"]
-            self.strategy_system.strategy = state["strategy"]
+            if self._strategy_system is None:
+                self.saved_strategy = state["strategy"]  # Объект стратегии ещё не создан
+            else:
+                self._strategy_system.strategy = state["strategy"]
 
 class BasicPokerStrategy:
+    rng = random  # Источник случайности, задаётся через PokerPlayer.set_rng
+
     def decide(self, game_state, dossier):
         """Простое принятие решения на основе случайности."""
-        return random.choice(['fold', 'call', 'raise'])
+        return self.rng.choice(['fold', 'call', 'raise'])
@@ -3,70 +3,72 @@ import asyncio
 import pickle
 from logging_system import Logger
 from hand_evaluator import HandEvaluator
+from table_balancer import TableBalancer
 
 class PokerGame:
+    rng = random  # Источник случайности; для воспроизводимых симуляций можно задать random.Random(seed)
+
     def __init__(self, players, config):
-        self.players = players
+        self.players = list(players)
+        self.entrants = len(self.players)  # Исходный размер поля, для призового фонда
         self.config = config
         self.current_round = 1
         self.pot = 0
+        self.balancer = TableBalancer(max_seats=8)
+        self.player_positions = {player: i for i, player in enumerate(self.players)}  # Индекс игрока в self.players
         self.tables = self.create_tables()  # Создание нескольких столов для турнира
-        self.community_cards = []
-        self.deck = self.create_deck()  # Создание и перемешивание колоды
         self.logger = Logger()
 
     def create_tables(self):
         """Создание столов и рассадка игроков."""
-        players_per_table = 8
-        num_tables = len(self.players) // players_per_table
-        
-        tables = []
-        for i in range(num_tables):
-            table = self.players[i * players_per_table:(i + 1) * players_per_table]
-            tables.append(table)
-        return tables
+        return self.balancer.seat_players(self.players)
 
     def create_deck(self):
         """Создание и перемешивание новой колоды карт."""
         ranks = list(range(2, 11)) + ['J', 'Q', 'K', 'A']
         suits = ['hearts', 'diamonds', 'clubs', 'spades']
         deck = [(rank, suit) for rank in ranks for suit in suits]
-        random.shuffle(deck)
+        self.rng.shuffle(deck)
         return deck
 
     def deal_hole_cards(self, table):
         """Раздача по две карты каждому игроку за столом."""
+        deck = table.state['deck']
         for player in table:
-            player.hole_cards = [self.deck.pop(), self.deck.pop()]
+            player.hole_cards = [deck.pop(), deck.pop()]
             self.logger.log_event(f"{player.name} получает карманные карты {player.hole_cards}")
 
-    def deal_community_cards(self, number):
+    def deal_community_cards(self, table, number):
         """Выдача указанного количества общих карт (флоп, терн, ривер)."""
         for _ in range(number):
-            card = self.deck.pop()
-            self.community_cards.append(card)
+            card = table.state['deck'].pop()
+            table.state['community_cards'].append(card)
             self.logger.log_event(f"Сдана общая карта: {card}")
 
     async def play_one_table(self, table, blinds):
         """Игра за одним столом с заданными блайндами."""
+        # У каждого стола своя колода и общие карты: столы играют одновременно
+        table.state['deck'] = deck = self.create_deck()
+        table.state['community_cards'] = []
+
         self.collect_blinds(table, blinds)
         self.deal_hole_cards(table)
 
         await self.conduct_betting_round(table, "Pre-Flop")
-        self.deck.pop()  # "Сжигание" карты
+        deck.pop()  # "Сжигание" карты
 
         # Флоп: выдача 3 общих карт
-        self.deal_community_cards(3)
+        self.deal_community_cards(table, 3)
         await self.conduct_betting_round(table, "Flop")
-        self.deck.pop()  # Burn card
+        deck.pop()  # Burn card
 
         # Терн: выдача 1 общей карты
-        self.deal_community_cards(1)
+        self.deal_community_cards(table, 1)
         await self.conduct_betting_round(table, "Turn")
-        self.deck.pop()  # Burn card
+        deck.pop()  # Burn card
 
         # Ривер: выдача 1 общей карты
-        self.deal_community_cards(1)
+        self.deal_community_cards(table, 1)
         await self.conduct_betting_round(table, "River")
 
         winner = self.showdown(table)
@@ -79,6 +81,8 @@ class PokerGame:
         table[0].stack -= small_blind  
         table[1].stack -= big_blind
         self.pot += small_blind + big_blind
+        self.check_bust(table[0])
+        self.check_bust(table[1])
 
         self.logger.log_event(f"{table[0].name} поставил маленький блайнд {small_blind}")
         self.logger.log_event(f"{table[1].name} поставил большой блайнд {big_blind}")
@@ -87,9 +91,9 @@ class PokerGame:
         """Проводим круг ставок для каждого игрока на этом столе."""
         for player in table:
             game_state = {
-                "current_bet": random.randint(10, 100),  # Пример текущей ставки
+                "current_bet": self.rng.randint(10, 100),  # Пример текущей ставки
                 "current_player": player,
-                "community_cards": self.community_cards
+                "community_cards": table.state['community_cards']
             }
             decision = player.make_decision(game_state)
             self.logger.log_decision(player.name, decision, game_state)
@@ -97,14 +101,14 @@ class PokerGame:
             if decision == "call":
                 self.pot += game_state["current_bet"]
             elif decision == "raise":
-                raise_amount = random.randint(10, 100)
+                raise_amount = self.rng.randint(10, 100)
                 self.pot += raise_amount
             
             await asyncio.sleep(0)  # Асинхронность
 
     def showdown(self, table):
         """Определение победителя на конкретном столе."""
-        hands = {player: player.hole_cards + self.community_cards for player in table}
+        hands = {player: player.hole_cards + table.state['community_cards'] for player in table}
         
         best_hand_value = None
         best_player = None
@@ -128,14 +132,29 @@ class PokerGame:
         self.logger.log_result(winner.name, self.pot)
         self.pot = 0
 
+    def check_bust(self, player):
+        """Сообщает балансировщику о возможном вылете игрока; вызывается после уменьшения стека."""
+        if player.stack <= 0:
+            self.balancer.report_bust(player)
+
+    def remove_player(self, player):
+        """Удаление выбывшего игрока из self.players за O(1): на его место ставится последний игрок."""
+        position = self.player_positions.pop(player)
+        last = self.players.pop()
+        if last is not player:
+            self.players[position] = last
+            self.player_positions[last] = position
+
     def reorganize_tables(self):
-        """Перераспределение игроков по столам после каждого раунда."""
-        self.players = [player for table in self.tables for player in table if player.stack > 0]
-        
-        if len(self.players) <= 8:
-            self.tables = [self.players]
-        else:
-            self.tables = self.create_tables()
+        """Перераспределение игроков по столам после каждого раунда.
+
+        Пересаживаются только те игроки, которых необходимо пересадить; столы и их состояние сохраняются.
+        """
+        for player in self.balancer.remove_busted():
+            self.remove_player(player)
+
+        for player, from_table, to_table in self.balancer.rebalance():
+            self.logger.log_event(f"{player.name} пересаживается со стола {from_table} за стол {to_table}")
 
     def save_game(self, file_name):
         """Сохранение текущего состояния игры."""
@@ -161,7 +180,6 @@ class PokerGame:
 
     async def play_round(self):
         """Игровой процесс одного раунда."""
-        self.deck = self.create_deck()
         blinds = self.config.get_blinds_for_round(self.current_round)
         
         coroutines = [self.play_one_table(table, blinds) for table in self.tables]
@@ -0,0 +1,158 @@
+# table_balancer.py
+
+class Table(list):
+    """Стол турнира: список игроков с постоянным идентификатором и собственным состоянием."""
+
+    def __init__(self, table_id, players=()):
+        super().__init__(players)
+        self.table_id = table_id
+        self.state = {}  # Данные, привязанные к столу (кэши, номер шарда и т.п.)
+
+    # Столы сравниваются по идентичности, а не по составу игроков, и могут быть ключами словаря
+    def __eq__(self, other):
+        return self is other
+
+    def __ne__(self, other):
+        return self is not other
+
+    def __hash__(self):
+        return hash(self.table_id)
+
+    def __repr__(self):
+        return f"Table({self.table_id}, {list.__repr__(self)})"
+
+
+class TableBalancer:
+    """
+    Балансировка столов с минимальным количеством пересадок игроков.
+
+    Балансировщик хранит рассадку между раундами: стол каждого игрока и столы, разложенные
+    по размерам. Выбывших игроков сообщает код, изменяющий стеки (report_bust), поэтому
+    стоимость перебалансировки зависит от числа выбывших и пересадок, а не от размера поля.
+    """
+
+    def __init__(self, max_seats=8):
+        self.max_seats = max_seats
+        self.next_table_id = 1
+        self.tables = []  # Список столов, общий с PokerGame.tables
+        self.table_positions = {}  # table_id -> индекс стола в self.tables
+        self.size_buckets = {}  # размер стола -> {table_id: стол}
+        self.seats = {}  # игрок -> стол
+        self.pending_busts = {}  # игроки, чей стек опускался до нуля (упорядоченное множество)
+        self.player_count = 0
+
+    def new_table(self, players=()):
+        """Создание стола с новым идентификатором."""
+        table = Table(self.next_table_id, players)
+        self.next_table_id += 1
+        return table
+
+    def seat_players(self, players):
+        """Начальная рассадка: все игроки за столами, размеры столов отличаются не более чем на один."""
+        if not players:
+            return self.tables
+
+        num_tables = -(-len(players) // self.max_seats)  # Округление вверх, никто не остаётся без места
+        new_tables = [self.new_table() for _ in range(num_tables)]
+        for i, player in enumerate(players):
+            table = new_tables[i % num_tables]
+            table.append(player)
+            self.seats[player] = table
+
+        for table in new_tables:
+            self.add_table(table)
+        self.player_count += len(players)
+        return self.tables
+
+    def report_bust(self, player):
+        """Отметка игрока, чей стек опустился до нуля; окончательно проверяется в remove_busted."""
+        self.pending_busts[player] = None
+
+    def remove_busted(self):
+        """Удаление со столов отмеченных игроков, у которых стек так и остался нулевым. Возвращает выбывших."""
+        busted = []
+        for player in self.pending_busts:
+            if player.stack <= 0 and player in self.seats:
+                table = self.seats.pop(player)
+                self.discard_from_bucket(table)
+                table.remove(player)
+                self.add_to_bucket(table)
+                busted.append(player)
+
+        self.pending_busts.clear()
+        self.player_count -= len(busted)
+        return busted
+
+    def rebalance(self):
+        """
+        Перебалансировка столов на месте.
+
+        Разбиваются самые короткие столы, затем игроки пересаживаются с самых длинных столов
+        на самые короткие, пока размеры не будут отличаться не более чем на один.
+        Остальные игроки и столы не трогаются. Возвращает список пересадок
+        в виде (игрок, id стола-источника, id стола-назначения).
+        """
+        moves = []
+        target_tables = max(1, -(-self.player_count // self.max_seats))
+
+        # Разбиваем самые короткие столы, пока столов больше необходимого
+        while len(self.tables) > target_tables:
+            broken = self.shortest_table()
+            self.remove_table(broken)
+            while broken:
+                player = broken.pop()
+                destination = self.shortest_table()
+                self.seat(player, destination)
+                moves.append((player, broken.table_id, destination.table_id))
+
+        # Выравниваем размеры столов
+        while self.tables:
+            longest = self.longest_table()
+            shortest = self.shortest_table()
+            if len(longest) - len(shortest) <= 1:
+                break
+            self.discard_from_bucket(longest)
+            player = longest.pop()
+            self.add_to_bucket(longest)
+            self.seat(player, shortest)
+            moves.append((player, longest.table_id, shortest.table_id))
+
+        return moves
+
+    def seat(self, player, table):
+        """Посадка игрока за стол с обновлением корзины размеров."""
+        self.discard_from_bucket(table)
+        table.append(player)
+        self.add_to_bucket(table)
+        self.seats[player] = table
+
+    def shortest_table(self):
+        bucket = self.size_buckets[min(self.size_buckets)]
+        return next(iter(bucket.values()))
+
+    def longest_table(self):
+        bucket = self.size_buckets[max(self.size_buckets)]
+        return next(iter(bucket.values()))
+
+    def add_table(self, table):
+        self.table_positions[table.table_id] = len(self.tables)
+        self.tables.append(table)
+        self.add_to_bucket(table)
+
+    def remove_table(self, table):
+        """Удаление стола за O(1): на его место в списке ставится последний стол."""
+        position = self.table_positions.pop(table.table_id)
+        last = self.tables.pop()
+        if last is not table:
+            self.tables[position] = last
+            self.table_positions[last.table_id] = position
+        self.discard_from_bucket(table)
+
+    def add_to_bucket(self, table):
+        self.size_buckets.setdefault(len(table), {})[table.table_id] = table
+
+    def discard_from_bucket(self, table):
+        bucket = self.size_buckets[len(table)]
+        del bucket[table.table_id]
+        if not bucket:
+            del self.size_buckets[len(table)]
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import app
+import cli
+
+
+def test_importing_app_does_not_import_flask_or_sqlite():
+    code = "import sys, app; print('flask' in sys.modules, 'sqlite3' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=app.__file__.rsplit("/", 1)[0]).stdout
+    assert output.split() == ["False", "False"]
+
+
+def test_failed_command_exits_non_zero(monkeypatch, capsys):
+    async def failing_main(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(app, "main", failing_main)
+    assert cli.main(["simulate", "--players", "2"]) == 1
+    assert "boom" in capsys.readouterr().err
+
+
+def test_bench_runs(capsys):
+    assert cli.main(["bench", "--players", "30", "--rounds", "5"]) == 0
+    assert "reorganize_tables" in capsys.readouterr().out
+
+
+def test_config_is_accepted_after_subcommand(work_dir):
+    (work_dir / "config.json").write_text('{"mccfr_iterations": 3}', encoding='utf-8')
+    for argv in (["train", "--config", "config.json"], ["--config", "config.json", "train"]):
+        assert cli.build_parser().parse_args(argv).config == "config.json"
+    assert cli.build_parser().parse_args(["train"]).config is None
+
+
+def test_train_keeps_every_player_state(work_dir, capsys):
+    (work_dir / "config.json").write_text('{"mccfr_iterations": 3}', encoding='utf-8')
+    assert cli.main(["train", "--players", "8", "--config", "config.json"]) == 0
+    assert len(list(work_dir.glob("*_state.pkl"))) == 8
+    assert "3 итераций" in capsys.readouterr().out
+
+
+def test_setup_tournament_uses_configured_iterations():
+    from config import PokerTournamentConfig
+
+    config = PokerTournamentConfig()
+    config.mccfr_iterations = 7
+    game = app.setup_tournament(3, config=config)
+    assert all(player.strategy_system.iterations == 7 for player in game.players)
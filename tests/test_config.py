@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from config import PokerTournamentConfig
+
+
+def write_config(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return str(path)
+
+
+def test_from_file_overrides_defaults(work_dir):
+    file_name = write_config(work_dir / "config.json", {
+        "starting_stack": 5000,
+        "blinds_structure": {"1": {"small_blind": 25, "big_blind": 50, "ante": 5}},
+        "payout_structure": {"1": 0.7, "2": 0.3},
+    })
+    config = PokerTournamentConfig.from_file(file_name)
+
+    assert config.starting_stack == 5000
+    assert config.get_blinds_for_round(1)['big_blind'] == 50
+    assert config.initial_blinds_structure == {1: {'small_blind': 25, 'big_blind': 50, 'ante': 5}}
+    assert config.payout_structure == {1: 0.7, 2: 0.3}
+    assert config.round_duration_minutes == PokerTournamentConfig().round_duration_minutes
+
+
+def test_from_file_rejects_unknown_keys(work_dir):
+    file_name = write_config(work_dir / "config.json", {"starting_stak": 5000})
+    with pytest.raises(ValueError, match="starting_stak"):
+        PokerTournamentConfig.from_file(file_name)
+
+
+def test_from_file_rejects_non_object(work_dir):
+    file_name = write_config(work_dir / "config.json", [1, 2, 3])
+    with pytest.raises(ValueError):
+        PokerTournamentConfig.from_file(file_name)
+
+
+def test_from_file_validates_values(work_dir):
+    file_name = write_config(work_dir / "config.json", {"starting_stack": -1})
+    with pytest.raises(ValueError):
+        PokerTournamentConfig.from_file(file_name)
+
+
+def test_from_file_sets_mccfr_iterations(work_dir):
+    file_name = write_config(work_dir / "config.json", {"mccfr_iterations": 25})
+    assert PokerTournamentConfig.from_file(file_name).mccfr_iterations == 25
+
+
+@pytest.mark.parametrize("data", [
+    {"blinds_structure": 5},
+    {"blinds_structure": {"1": 100}},
+    {"payout_structure": [0.5, 0.5]},
+])
+def test_from_file_rejects_malformed_structures(work_dir, data):
+    file_name = write_config(work_dir / "config.json", data)
+    with pytest.raises(ValueError):
+        PokerTournamentConfig.from_file(file_name)
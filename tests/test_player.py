@@ -0,0 +1,36 @@
+from mccfr import MCCFR
+from player import BasicPokerStrategy, PokerPlayer
+
+
+def test_strategy_object_is_created_on_first_use():
+    player = PokerPlayer("p", 1000)
+    assert player._strategy_system is None
+    assert isinstance(player.strategy_system, MCCFR)
+    assert player.strategy_system is player.strategy_system
+
+    basic = PokerPlayer("b", 1000, use_mccfr=False)
+    assert isinstance(basic.strategy_system, BasicPokerStrategy)
+
+
+def test_saved_state_is_loaded_eagerly_and_strategy_lazily(work_dir):
+    trained = PokerPlayer("p", 1000, iterations=5)
+    trained.record_opponent_action("v", "call")
+    trained.strategy_system.run_iterations([{"current_bet": 100}])
+    trained.save_state()
+
+    player = PokerPlayer("p", 1000, state_file="p_state.pkl")
+    assert player._strategy_system is None
+    assert player.dossier == {"v": {"aggro": 0, "fold": 0, "call": 1, "bluff": 0}}
+
+    player.record_opponent_action("w", "fold")
+    assert dict(player.strategy_system.strategy) == dict(trained.strategy_system.strategy)
+    assert set(player.dossier) == {"v", "w"}
+
+
+def test_mccfr_decision_uses_current_game_state():
+    player = PokerPlayer("p", 1000, iterations=3)
+    decision = player.make_decision({"current_bet": 50, "current_player": player, "community_cards": []})
+
+    assert decision in ("fold", "call", "raise")
+    assert player.history[-1]["decision"] == decision
+    player.adjust_strategy()
@@ -0,0 +1,30 @@
+import asyncio
+import random
+
+from config import PokerTournamentConfig
+from hand_evaluator import HandEvaluator
+from player import PokerPlayer
+from poker_game import PokerGame
+
+
+def test_evaluate_hand_accepts_lists():
+    hand = [(10, 'hearts'), (10, 'spades'), ('K', 'clubs'), (2, 'hearts'), (5, 'diamonds')]
+    assert HandEvaluator.evaluate_hand(hand)[0] == "One Pair"
+
+
+def test_blinds_levels_are_added_without_gaps():
+    config = PokerTournamentConfig()
+    big_blind = config.get_blinds_for_round(14)['big_blind']
+    assert config.get_blinds_for_round(12)['big_blind'] * 4 == big_blind
+
+
+def test_tournament_with_several_tables_finishes():
+    rng = random.Random(6)
+    players = [PokerPlayer(f"p{i}", 10000, use_mccfr=False) for i in range(30)]
+    for player in players:
+        player.set_rng(rng)
+    game = PokerGame(players, PokerTournamentConfig())
+    game.rng = rng
+
+    asyncio.run(game.simulate_tournament())
+    assert len(game.players) == 1
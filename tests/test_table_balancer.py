@@ -0,0 +1,138 @@
+import copy
+
+from config import PokerTournamentConfig
+from player import PokerPlayer
+from poker_game import PokerGame
+from table_balancer import Table, TableBalancer
+
+
+class FakePlayer:
+    def __init__(self, name, stack=100):
+        self.name = name
+        self.stack = stack
+
+    def __repr__(self):
+        return self.name
+
+
+def make_players(count):
+    return [FakePlayer(f"p{i}") for i in range(count)]
+
+
+def sizes(tables):
+    return sorted(len(table) for table in tables)
+
+
+def bust(balancer, *players):
+    for player in players:
+        player.stack = 0
+        balancer.report_bust(player)
+
+
+def test_seat_players_seats_everyone_within_one():
+    balancer = TableBalancer(max_seats=8)
+    players = make_players(163)
+    tables = balancer.seat_players(players)
+
+    assert len(tables) == 21
+    assert sum(len(table) for table in tables) == 163
+    assert max(sizes(tables)) - min(sizes(tables)) <= 1
+    assert {id(p) for table in tables for p in table} == {id(p) for p in players}
+
+
+def test_single_bust_needs_no_moves():
+    balancer = TableBalancer(max_seats=8)
+    players = make_players(23)  # 8, 8, 7
+    tables = balancer.seat_players(players)
+    table_ids = [table.table_id for table in tables]
+
+    bust(balancer, tables[0][0])
+    assert len(balancer.remove_busted()) == 1
+    assert balancer.rebalance() == []
+    assert [table.table_id for table in tables] == table_ids
+
+
+def test_uneven_tables_move_only_one_player():
+    balancer = TableBalancer(max_seats=8)
+    tables = balancer.seat_players(make_players(24))  # 8, 8, 8
+    bust(balancer, tables[0][0], tables[0][1])
+    balancer.remove_busted()
+
+    moves = balancer.rebalance()
+    assert len(moves) == 1
+    assert moves[0][2] == tables[0].table_id
+    assert sizes(tables) == [7, 7, 8]
+
+
+def test_shortest_table_is_broken_and_others_keep_identity():
+    balancer = TableBalancer(max_seats=8)
+    tables = balancer.seat_players(make_players(17))  # 6, 6, 5
+    short = min(tables, key=len)
+    survivors = [table for table in tables if table is not short]
+
+    bust(balancer, short[0])
+    balancer.remove_busted()
+    moves = balancer.rebalance()
+
+    assert len(moves) == 4
+    assert all(from_id == short.table_id for _, from_id, _ in moves)
+    assert len(tables) == 2
+    assert all(any(table is survivor for table in tables) for survivor in survivors)
+    assert sizes(tables) == [8, 8]
+    assert all(balancer.seats[player] is table for table in tables for player in table)
+
+
+def test_only_reported_players_with_empty_stack_are_removed():
+    balancer = TableBalancer(max_seats=8)
+    tables = balancer.seat_players(make_players(8))
+    unreported, revived = tables[0][0], tables[0][1]
+    unreported.stack = 0
+    bust(balancer, revived)
+    revived.stack = 50  # Выиграл банк после блайнда
+
+    assert balancer.remove_busted() == []
+    assert len(tables[0]) == 8
+
+
+def test_tables_compare_by_identity():
+    first, second = Table(1), Table(2)
+    assert first != second
+    assert first == first
+    assert {first: "a", second: "b"}[second] == "b"
+
+    tables = [first, second]
+    tables.remove(second)
+    assert tables[0] is first
+
+
+def test_game_drops_busted_players_and_survives_deepcopy():
+    players = [PokerPlayer(f"p{i}", 1000, use_mccfr=False) for i in range(20)]
+    game = PokerGame(players, PokerTournamentConfig())
+    table_ids = {table.table_id for table in game.tables}
+
+    for player in players[:5]:
+        player.stack = 0
+        game.check_bust(player)
+    game.reorganize_tables()
+
+    assert sorted(p.name for p in game.players) == sorted(p.name for p in players[5:])
+    assert all(game.players[i] is p for p, i in game.player_positions.items())
+    assert {table.table_id for table in game.tables} <= table_ids
+    assert sizes(game.tables) == [7, 8]
+
+    copied = copy.deepcopy(game, {id(game.logger): game.logger})
+    copied.players[0].stack = 0
+    copied.check_bust(copied.players[0])
+    copied.reorganize_tables()
+    assert len(copied.players) == 14
+    assert len(game.players) == 15
+
+
+def test_game_accepts_players_iterator():
+    players = [PokerPlayer(f"p{i}", 1000, use_mccfr=False) for i in range(10)]
+    game = PokerGame(iter(players), PokerTournamentConfig())
+
+    players[0].stack = 0
+    game.check_bust(players[0])
+    game.reorganize_tables()
+    assert len(game.players) == 9
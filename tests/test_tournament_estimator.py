@@ -0,0 +1,136 @@
+import asyncio
+import random
+
+import pytest
+
+from config import PokerTournamentConfig
+from player import PokerPlayer
+from poker_game import PokerGame
+from tournament_estimator import RunningStats, TournamentEstimator
+
+
+def make_game(count, stack=10000):
+    players = [PokerPlayer(f"p{i}", stack, use_mccfr=False) for i in range(count)]
+    return PokerGame(players, PokerTournamentConfig())
+
+
+def test_interval_is_agresti_coull_for_binary_values():
+    stats = RunningStats()
+    for value in [1, 0, 0, 1, 0, 0, 0, 0, 0, 0]:
+        stats.add(value)
+
+    z = 1.96
+    n = 10 + z * z
+    p = (2 + z * z / 2) / n
+    half_width = z * (p * (1 - p) / n) ** 0.5
+    low, high = stats.interval(z, 0.0, 1.0)
+    assert low == pytest.approx(p - half_width)
+    assert high == pytest.approx(p + half_width)
+
+
+def test_zero_variance_sample_has_non_zero_interval():
+    stats = RunningStats()
+    for _ in range(30):
+        stats.add(0.0)
+    low, high = stats.interval(1.96, 0.0, 1.0)
+    assert high - low > 0.05
+
+
+def test_degenerate_sample_does_not_stop_early():
+    game = make_game(8)
+    game.players[7].stack = 500
+    estimator = TournamentEstimator(game, fast_forward_below=8, rng=random.Random(1))
+
+    result = estimator.estimate({'itm': 0.01}, players=[game.players[7]])
+    itm = result["players"][game.players[7]]['itm']
+    assert result["converged"]
+    assert result["samples"] > 1000
+    assert 0 < itm["mean"] < 0.5
+    assert itm["half_width"] <= 0.01
+
+
+def test_sample_count_follows_requested_precision():
+    game = make_game(12)
+    estimator = TournamentEstimator(game, fast_forward_below=12, rng=random.Random(2))
+
+    loose = estimator.estimate({'roi': 0.2}, players=game.players[:2])
+    tight = estimator.estimate({'roi': 0.1}, players=game.players[:2])
+    assert loose["converged"] and tight["converged"]
+    assert tight["samples"] > 2 * loose["samples"]
+
+
+def test_zero_stack_player_finishes_last():
+    game = make_game(12)
+    game.players[3].stack = 0
+    for fast_forward_below in (12, 4):
+        estimator = TournamentEstimator(game, fast_forward_below=fast_forward_below, rng=random.Random(3))
+        finishes = estimator.simulate_continuation()
+        assert finishes[game.players[3]] == 12
+        assert sorted(finishes.values()) == list(range(1, 13))
+
+
+def test_unknown_players_and_metrics_are_rejected():
+    game = make_game(8)
+    estimator = TournamentEstimator(game, fast_forward_below=8)
+    with pytest.raises(ValueError, match="stranger"):
+        estimator.estimate({'finish': 1.0}, players=[PokerPlayer("stranger", 100)])
+    with pytest.raises(ValueError):
+        estimator.estimate({'profit': 1.0})
+
+
+def test_estimate_replays_full_rounds_reproducibly():
+    game = make_game(20)
+    first = TournamentEstimator(game, fast_forward_below=4, rng=random.Random(4))
+    second = TournamentEstimator(game, fast_forward_below=4, rng=random.Random(4))
+    assert first.simulate_continuation() == second.simulate_continuation()
+
+    result = first.estimate({'finish': 20.0}, min_samples=3, max_samples=3)
+    assert result["samples"] == 3
+    assert set(result["players"]) == set(game.players)
+    assert all(1 <= stats['finish']["mean"] <= 20 for stats in result["players"].values())
+    assert [player.stack for player in game.players] == [10000] * 20  # Снимок не меняет исходную игру
+
+
+def test_estimate_async_runs_inside_event_loop():
+    game = make_game(12)
+    estimator = TournamentEstimator(game, fast_forward_below=4, rng=random.Random(5))
+
+    async def run():
+        return await estimator.estimate_async({'finish': 12.0}, min_samples=2, max_samples=2)
+
+    assert asyncio.run(run())["samples"] == 2
+
+
+def test_estimate_does_not_write_tournament_log(work_dir):
+    game = make_game(20)
+    log_file = work_dir / "tournament_log.txt"
+    size_before = log_file.stat().st_size
+
+    estimator = TournamentEstimator(game, rng=random.Random(6))
+    estimator.estimate({'finish': 20.0}, min_samples=2, max_samples=2)
+    assert log_file.stat().st_size == size_before
+
+
+def test_defaults_use_field_size_and_final_table_fast_forward():
+    game = make_game(20)
+    for player in game.players[:12]:
+        player.stack = 0
+        game.check_bust(player)
+    game.reorganize_tables()
+
+    estimator = TournamentEstimator(game)
+    assert estimator.entrants == 20
+    assert estimator.payouts[1] == 0.5 * 20 * 10000
+    assert estimator.fast_forward_below == 8
+    assert estimator.fast_forward_only
+
+
+def test_snapshot_leaves_out_decision_history():
+    game = make_game(12)
+    for player in game.players:
+        player.history.extend({"game_state": {"current_bet": 10}, "decision": "call"} for _ in range(100))
+
+    estimator = TournamentEstimator(game, fast_forward_below=4, rng=random.Random(7))
+    assert all(player.history == [] for player in estimator.snapshot.players)
+    estimator.simulate_continuation()
+    assert all(len(player.history) == 100 for player in game.players)
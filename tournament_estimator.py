@@ -0,0 +1,306 @@
+# tournament_estimator.py
+
+import asyncio
+import copy
+import math
+import random
+from statistics import NormalDist
+from logging_system import NullLogger
+
+METRICS = ('finish', 'itm', 'roi')
+
+class RunningStats:
+    """Онлайн-среднее и дисперсия (алгоритм Уэлфорда)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        """Выборочная дисперсия."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.inf
+
+    def interval(self, z, low, high):
+        """
+        Доверительный интервал для среднего величины, ограниченной отрезком [low, high].
+
+        Интервал Агрести–Коулла, обобщённый на ограниченные величины: к выборке добавляется
+        по z²/2 псевдонаблюдений на каждой границе. Для величин 0/1 это в точности интервал
+        Агрести–Коулла, а выборка без разброса не даёт интервала нулевой ширины.
+        """
+        pseudo_count = z * z
+        count = self.count + pseudo_count
+        delta = (low + high) / 2 - self.mean
+        mean = self.mean + delta * pseudo_count / count
+        m2 = self.m2 + pseudo_count * ((high - low) / 2) ** 2 + delta * delta * self.count * pseudo_count / count
+        half_width = z * math.sqrt(m2 / count / count)
+        return mean - half_width, mean + half_width
+
+class EstimateTracker:
+    """Накопление метрик по продолжениям турнира и проверка достигнутой точности."""
+
+    def __init__(self, estimator, targets, players, confidence):
+        self.estimator = estimator
+        self.targets = targets
+        self.players = players
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.bounds = estimator.metric_bounds()
+        self.stats = {player: {metric: RunningStats() for metric in targets} for player in players}
+        self.samples = 0
+        self.converged = False
+
+    def half_width(self, metric, running):
+        low, high = running.interval(self.z, *self.bounds[metric])
+        return (high - low) / 2
+
+    def add(self, finishes, min_samples):
+        """Учёт одного продолжения. Возвращает True, когда все метрики достигли точности."""
+        self.samples += 1
+        for player in self.players:
+            values = self.estimator.metric_values(finishes[player])
+            for metric, running in self.stats[player].items():
+                running.add(values[metric])
+
+        if self.samples >= min_samples:
+            self.converged = all(
+                self.half_width(metric, running) <= self.targets[metric]
+                for player_stats in self.stats.values()
+                for metric, running in player_stats.items()
+            )
+        return self.converged
+
+    def result(self):
+        players = {}
+        for player, player_stats in self.stats.items():
+            players[player] = {}
+            for metric, running in player_stats.items():
+                low, high = running.interval(self.z, *self.bounds[metric])
+                players[player][metric] = {
+                    "mean": running.mean, "half_width": (high - low) / 2, "low": low, "high": high,
+                }
+        return {"samples": self.samples, "converged": self.converged, "players": players}
+
+class TournamentEstimator:
+    """
+    Оценка ожидаемого места, вероятности попадания в призы и ROI игроков методом Монте-Карло
+    из текущего состояния турнира.
+
+    Продолжения турнира разыгрываются по одному, пока каждая запрошенная метрика не достигнет
+    заданной точности. Пока игроков больше `fast_forward_below` (по умолчанию — мест за одним
+    столом), раунды разыгрываются полностью (PokerGame.play_round), затем турнир доигрывается
+    упрощённой моделью "олл-ин или фолд". При fast_forward_below >= числу игроков карты не
+    раздаются вовсе, и время ответа зависит только от требуемой точности.
+    Все случайные решения, включая полную раздачу, берутся из `rng`. Симуляции ничего не пишут в журнал.
+
+    Призовой фонд считается по исходному размеру поля (PokerGame.entrants) и бай-ину, равному
+    начальному стеку, если `entrants` и `buy_in` не заданы явно.
+
+    Полная раздача асинхронная: синхронные estimate/simulate_continuation запускают свой цикл
+    событий и не могут вызываться из работающего цикла — там используйте estimate_async.
+    """
+
+    def __init__(self, game, buy_in=None, entrants=None, fast_forward_below=None,
+                 call_probability=0.5, hands_per_level=10, rng=None):
+        self.players = list(game.players)
+        self.snapshot = self.copy_game(game)
+        self.config = self.snapshot.config
+        self.blinds_config = copy.deepcopy(self.config)  # get_blinds_for_round дописывает новые уровни
+        self.buy_in = buy_in if buy_in is not None else self.config.starting_stack
+        self.entrants = entrants if entrants is not None else self.snapshot.entrants
+        self.payouts = self.config.get_payouts(self.buy_in * self.entrants)
+        if fast_forward_below is None:
+            fast_forward_below = self.snapshot.balancer.max_seats  # Финальный стол доигрывается упрощённо
+        self.fast_forward_below = fast_forward_below
+        self.call_probability = call_probability
+        self.hands_per_level = hands_per_level
+        self.rng = rng or random.Random()
+
+    @staticmethod
+    def copy_game(game, memo=None):
+        """
+        Копия игры для симуляции: без журнала и без истории решений игроков.
+
+        Копируются только стеки, рассадка, номер раунда и стратегии; история решений
+        растёт с каждым раундом и для розыгрыша не нужна.
+        """
+        if memo is None:
+            memo = {}
+        memo[id(game.logger)] = NullLogger()
+        for player in game.players:
+            memo[id(player.history)] = []
+        return copy.deepcopy(game, memo)
+
+    @property
+    def fast_forward_only(self):
+        """Снимок уже в зоне упрощённой модели: копировать игру и раздавать карты не нужно."""
+        return len(self.snapshot.players) <= max(self.fast_forward_below, 1)
+
+    def continuations(self):
+        """Бесконечный поток симулированных продолжений: {игрок: занятое место}."""
+        while True:
+            yield self.simulate_continuation()
+
+    async def continuations_async(self):
+        """Асинхронный вариант continuations для вызова из работающего цикла событий."""
+        while True:
+            yield await self.simulate_continuation_async()
+
+    def simulate_continuation(self):
+        """Одно продолжение турнира от сохранённого состояния до победителя."""
+        if self.fast_forward_only:
+            return self.fast_forward_snapshot()
+        return asyncio.run(self.simulate_continuation_async())
+
+    def fast_forward_snapshot(self):
+        """Продолжение только упрощённой моделью, прямо по стекам снимка."""
+        finishes = {}
+        stacks = [[player, copied.stack] for player, copied in zip(self.players, self.snapshot.players)]
+        self.fast_forward(stacks, self.snapshot.current_round, finishes)
+        return finishes
+
+    async def simulate_continuation_async(self):
+        """Одно продолжение турнира; полная раздача выполняется в текущем цикле событий."""
+        if self.fast_forward_only:
+            return self.fast_forward_snapshot()
+
+        finishes = {}
+        memo = {}
+        game = self.copy_game(self.snapshot, memo)
+        originals = {id(memo[id(copied)]): player for copied, player in zip(self.snapshot.players, self.players)}
+
+        game.rng = self.rng
+        for player in game.players:
+            player.set_rng(self.rng)
+
+        # Игроки без фишек в снимке выбывают сразу и занимают последние места
+        out = [player for player in game.players if player.stack <= 0]
+        if out:
+            for player in out:
+                game.check_bust(player)
+            game.reorganize_tables()
+            self.place_busted([(originals[id(player)], player.stack) for player in out], len(game.players), finishes)
+
+        await self.replay(game, originals, finishes)
+
+        stacks = [[originals[id(player)], player.stack] for player in game.players]
+        self.fast_forward(stacks, game.current_round, finishes)
+        return finishes
+
+    async def replay(self, game, originals, finishes):
+        """Полная раздача раундов, пока игроков больше порога упрощённой модели."""
+        while len(game.players) > max(self.fast_forward_below, 1):
+            stacks_before = {id(player): player.stack for player in game.players}
+            alive_before = list(game.players)
+
+            await game.play_round()
+            game.current_round += 1
+
+            alive_ids = {id(player) for player in game.players}
+            busted = [(originals[id(player)], stacks_before[id(player)])
+                      for player in alive_before if id(player) not in alive_ids]
+            self.place_busted(busted, len(game.players), finishes)
+
+    @staticmethod
+    def place_busted(busted, remaining, finishes):
+        """Места выбывших одновременно: ниже оставшихся, больший стек — более высокое место."""
+        busted = sorted(busted, key=lambda entry: entry[1], reverse=True)
+        for offset, (player, _) in enumerate(busted):
+            finishes[player] = remaining + offset + 1
+
+    def fast_forward(self, stacks, round_number, finishes):
+        """
+        Упрощённая модель доигрывания: случайный игрок идёт олл-ин, случайный соперник
+        отвечает с вероятностью call_probability, при вскрытии шансы равны.
+        """
+        self.place_busted([entry for entry in stacks if entry[1] <= 0],
+                          sum(1 for entry in stacks if entry[1] > 0), finishes)
+        stacks = [entry for entry in stacks if entry[1] > 0]
+        hands = 0
+        blinds = self.blinds_config.get_blinds_for_round(round_number)
+
+        while len(stacks) > 1:
+            shover, caller = self.rng.sample(stacks, 2)
+            if self.rng.random() < self.call_probability:
+                at_risk = min(shover[1], caller[1])
+                winner, loser = (shover, caller) if self.rng.random() < 0.5 else (caller, shover)
+            else:
+                at_risk = min(blinds['big_blind'], caller[1])
+                winner, loser = shover, caller
+            winner[1] += at_risk
+            loser[1] -= at_risk
+
+            if loser[1] <= 0:
+                finishes[loser[0]] = len(stacks)
+                stacks.remove(loser)
+
+            hands += 1
+            if hands % self.hands_per_level == 0:
+                round_number += 1
+                blinds = self.blinds_config.get_blinds_for_round(round_number)
+
+        for player, _ in stacks:
+            finishes[player] = 1
+
+    def metric_values(self, place):
+        """Значения метрик для занятого места."""
+        payout = self.payouts.get(place, 0)
+        return {
+            'finish': place,
+            'itm': 1.0 if payout > 0 else 0.0,
+            'roi': (payout - self.buy_in) / self.buy_in,
+        }
+
+    def metric_bounds(self):
+        """Границы значений каждой метрики, нужны для доверительных интервалов."""
+        best_payout = max(self.payouts.values(), default=0)
+        return {
+            'finish': (1, len(self.players)),
+            'itm': (0.0, 1.0),
+            'roi': (-1.0, best_payout / self.buy_in - 1),
+        }
+
+    def tracker(self, targets, players, confidence):
+        unknown = set(targets) - set(METRICS)
+        if unknown:
+            raise ValueError(f"Неизвестные метрики: {', '.join(sorted(unknown))}")
+
+        if players is None:
+            players = list(self.players)
+        else:
+            players = list(players)
+            known = {id(player) for player in self.players}
+            strangers = [player for player in players if id(player) not in known]
+            if strangers:
+                names = ', '.join(str(getattr(player, 'name', player)) for player in strangers)
+                raise ValueError(f"Игроков нет в снимке турнира: {names}")
+        return EstimateTracker(self, targets, players, confidence)
+
+    def estimate(self, targets, players=None, confidence=0.95, min_samples=30, max_samples=100000):
+        """
+        Розыгрыш продолжений до достижения точности.
+
+        targets: {метрика: допустимая полуширина доверительного интервала}, метрики из METRICS.
+        Возвращает словарь с числом продолжений, признаком сходимости и оценками
+        {игрок: {метрика: {"mean", "half_width", "low", "high"}}}.
+        """
+        tracker = self.tracker(targets, players, confidence)
+        for finishes in self.continuations():
+            if tracker.add(finishes, min_samples) or tracker.samples >= max_samples:
+                break
+        return tracker.result()
+
+    async def estimate_async(self, targets, players=None, confidence=0.95, min_samples=30, max_samples=100000):
+        """Асинхронный вариант estimate для вызова из работающего цикла событий."""
+        tracker = self.tracker(targets, players, confidence)
+        async for finishes in self.continuations_async():
+            if tracker.add(finishes, min_samples) or tracker.samples >= max_samples:
+                break
+        return tracker.result()